@@ -176,10 +176,11 @@ def fit_model(model, input_data, output_folder,
         model_name = model.name
         model_instance = model
 
-    if not model_instance.is_input_data_sufficient(input_data):
+    input_data_problems = model_instance.get_input_data_problems(input_data)
+    if input_data_problems:
         raise InsufficientProtocolError(
             'The provided protocol is insufficient for this model. '
-            'The reported errors where: {}'.format(model_instance.get_input_data_problems(input_data)))
+            'The reported errors where: {}'.format(input_data_problems))
 
     if post_processing:
         model_instance.update_active_post_processing('optimization', post_processing)
@@ -754,14 +755,24 @@ def write_volume_maps(maps, directory, header=None, overwrite_volumes=True, gzip
     write_all_as_nifti(maps, directory, nifti_header=header, overwrite_volumes=overwrite_volumes, gzip=gzip)
 
 
+_models_list_cache = {}
+
+
 def get_models_list():
     """Get a list of all available composite models
 
+    The result is cached and only recomputed after mutations to the component library, such that repeated
+    calls (for example for shell completion of the model names) do not rescan the library every time.
+
     Returns:
         list of str: A list of available model names.
     """
-    from mdt.lib.components import get_component_list
-    return list(sorted(get_component_list('composite_models')))
+    from mdt.lib.components import component_library
+    history_length = component_library.get_current_history_length()
+    if _models_list_cache.get('history_length') != history_length:
+        _models_list_cache['history_length'] = history_length
+        _models_list_cache['models'] = list(sorted(component_library.get_component_list('composite_models')))
+    return list(_models_list_cache['models'])
 
 
 def get_models_meta_info():
@@ -3,11 +3,10 @@
 """Print some basic information about a protocol."""
 import argparse
 import os
-import mdt
 from argcomplete.completers import FilesCompleter
 import textwrap
 
-from mdt.lib.shell_utils import BasicShellApplication
+from mdt.lib.shell_utils import BasicShellApplication, get_argparse_extension_checker
 
 __author__ = 'Robbert Harms'
 __date__ = "2015-08-18"
@@ -29,12 +28,13 @@ class InfoProtocol(BasicShellApplication):
                                          formatter_class=argparse.RawTextHelpFormatter)
 
         parser.add_argument('protocol',
-                            action=mdt.lib.shell_utils.get_argparse_extension_checker(['.prtcl']),
+                            action=get_argparse_extension_checker(['.prtcl']),
                             help='the protocol file').completer = FilesCompleter(['prtcl'], directories=False)
 
         return parser
 
     def run(self, args, extra_args):
+        import mdt
         protocol = mdt.load_protocol(os.path.realpath(args.protocol))
         self.print_info(protocol)
 
@@ -50,7 +50,7 @@ class InfoProtocol(BasicShellApplication):
 
         shells_text = []
         for shell in shells:
-            shells_text.append('{0:0=.3f}e9 ({1})'.format(shell['b_value'] / 1e9, shell['nmr_items']))
+            shells_text.append('{0:0=.3f}e9 ({1})'.format(shell['b_value'] / 1e9, shell['nmr_volumes']))
         print(row_format.format('shells', ', '.join(shells_text)))
 
         print(row_format.format('nmr_columns', protocol.number_of_columns))
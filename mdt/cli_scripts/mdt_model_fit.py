@@ -9,12 +9,9 @@ floating point value. To use a voxel wise noise std, please give it a filename w
 """
 import argparse
 import os
-import mdt
 from argcomplete.completers import FilesCompleter
 
-import mdt.lib.input_data
-from mdt.lib.shell_utils import BasicShellApplication
-from mot.lib import cl_environments
+from mdt.lib.shell_utils import BasicShellApplication, get_argparse_extension_checker
 import textwrap
 
 __author__ = 'Robbert Harms'
@@ -25,11 +22,6 @@ __email__ = "robbert.harms@maastrichtuniversity.nl"
 
 class ModelFit(BasicShellApplication):
 
-    def __init__(self):
-        super().__init__()
-        self.available_devices = list((ind for ind, env in
-                                       enumerate(cl_environments.CLEnvironmentFactory.smart_device_selection())))
-
     def _get_arg_parser(self, doc_parser=False):
         description = textwrap.dedent(__doc__)
 
@@ -43,18 +35,18 @@ class ModelFit(BasicShellApplication):
 
         parser = argparse.ArgumentParser(description=description, epilog=epilog,
                                          formatter_class=argparse.RawTextHelpFormatter)
-        parser.add_argument('model', metavar='model', choices=mdt.get_models_list(),
+        parser.add_argument('model', metavar='model', type=self._check_model_name,
                             help='model name, see mdt-list-models')
         parser.add_argument('dwi',
-                            action=mdt.lib.shell_utils.get_argparse_extension_checker(['.nii', '.nii.gz', '.hdr', '.img']),
+                            action=get_argparse_extension_checker(['.nii', '.nii.gz', '.hdr', '.img']),
                             help='the diffusion weighted image').completer = FilesCompleter(['nii', 'gz', 'hdr', 'img'],
                                                                                             directories=False)
         parser.add_argument(
-            'protocol', action=mdt.lib.shell_utils.get_argparse_extension_checker(['.prtcl']),
+            'protocol', action=get_argparse_extension_checker(['.prtcl']),
             help='the protocol file, see mdt-create-protocol').completer = FilesCompleter(['prtcl'],
                                                                                           directories=False)
         parser.add_argument('mask',
-                            action=mdt.lib.shell_utils.get_argparse_extension_checker(['.nii', '.nii.gz', '.hdr', '.img']),
+                            action=get_argparse_extension_checker(['.nii', '.nii.gz', '.hdr', '.img']),
                             help='the (brain) mask to use').completer = FilesCompleter(['nii', 'gz', 'hdr', 'img'],
                                                                                directories=False)
         parser.add_argument('-o', '--output_folder',
@@ -66,11 +58,11 @@ class ModelFit(BasicShellApplication):
                                  'Either set this to a value, or to a filename.')
 
         parser.add_argument('--gradient-deviations',
-                            action=mdt.lib.shell_utils.get_argparse_extension_checker(['.nii', '.nii.gz', '.hdr', '.img']),
+                            action=get_argparse_extension_checker(['.nii', '.nii.gz', '.hdr', '.img']),
                             help="The volume with the gradient deviations to use, in HCP WUMINN format.").\
             completer = FilesCompleter(['nii', 'gz', 'hdr', 'img'], directories=False)
 
-        parser.add_argument('--cl-device-ind', type=int, nargs='*', choices=self.available_devices,
+        parser.add_argument('--cl-device-ind', type=self._check_cl_device_ind, nargs='*', metavar='IND',
                             help="The index of the device we would like to use. This follows the indices "
                                  "in mdt-list-devices and defaults to the first GPU.")
 
@@ -113,7 +105,36 @@ class ModelFit(BasicShellApplication):
 
         return parser
 
+    @staticmethod
+    def _check_model_name(value):
+        """Argument type checker that validates the model name against the component registry.
+
+        By importing mdt only when a model name is actually supplied, printing the help
+        does not pay the full package import cost.
+        """
+        import mdt
+        if value not in mdt.get_models_list():
+            raise argparse.ArgumentTypeError('{!r} is not one of the available models, '
+                                             'see mdt-list-models'.format(value))
+        return value
+
+    @staticmethod
+    def _check_cl_device_ind(value):
+        """Argument type checker that validates a device index against the available CL devices."""
+        from mot.lib.cl_environments import CLEnvironmentFactory
+        try:
+            index = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError('{!r} is not an integer device index'.format(value))
+        if not 0 <= index < len(CLEnvironmentFactory.smart_device_selection()):
+            raise argparse.ArgumentTypeError('{} is not a valid device index, '
+                                             'see mdt-list-devices'.format(index))
+        return index
+
     def run(self, args, extra_args):
+        import mdt
+        import mdt.lib.input_data
+
         mask_name = os.path.splitext(os.path.basename(os.path.realpath(args.mask)))[0]
         mask_name = mask_name.replace('.nii', '')
         output_folder = args.output_folder or os.path.join(os.path.dirname(args.dwi), 'output', mask_name)
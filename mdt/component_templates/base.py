@@ -24,6 +24,10 @@ class ComponentBuilder:
     def create_class(self, template):
         """Create a class of the right type given the information in the template.
 
+        The class is constructed only once per template: repeated calls with the same template return
+        a cached class, such that models which are rebuilt often do not regenerate their CL code and
+        parameter lists on every build.
+
         Args:
             template (ComponentTemplate): the information as a component config
 
@@ -32,6 +36,10 @@ class ComponentBuilder:
         """
         from mdt.lib.components import temporary_component_updates, add_template_component
 
+        constructed = template.__dict__.get('_constructed_class')
+        if constructed is not None:
+            return constructed
+
         cls = self._create_class(template)
 
         if template.subcomponents:
@@ -44,7 +52,9 @@ class ComponentBuilder:
                             add_template_component(component)
                         super().__init__(*args, **kwargs)
 
-            return SubComponentConstruct
+            cls = SubComponentConstruct
+
+        template._constructed_class = cls
         return cls
 
     def _create_class(self, template):
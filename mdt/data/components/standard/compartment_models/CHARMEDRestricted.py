@@ -9,23 +9,24 @@ __email__ = "robbert.harms@maastrichtuniversity.nl"
 class CHARMEDRestricted(CompartmentTemplate):
 
     parameters = ('g', 'b', 'G', 'Delta', 'delta', 'TE', 'd', 'theta', 'phi')
-    dependencies = ('SphericalToCartesian', 'NeumanCylinderLongApprox')
+    dependencies = ('DirectionSquared', 'NeumanCylinderLongApprox')
     cl_code = '''
-        double direction_2 = pown(dot(g, SphericalToCartesian(theta, phi)), 2);
-        double signal_par = -b * d * direction_2;
-        
-        float weights[] = {0.021184720085574, 0.107169623942214, 0.194400551313197,
-                           0.266676876170322, 0.214921653661151, 0.195646574827541};
-        float radii[] = {1.5e-6f, 2.5e-6f, 3.5e-6f, 4.5e-6f, 5.5e-6f, 6.5e-6f}; // meters
-        
-        double sum = 0;
-        double signal_perp;
-        
-        #pragma unroll
-        for(uint i = 0; i < 6; i++){
-            signal_perp = (1 - direction_2) * (delta * delta) * NeumanCylinderLongApprox(G, TE/2.0, d, radii[i]);
-            sum += weights[i] * exp(signal_par + signal_perp);
-        }
-        
-        return sum;
+        double direction_2 = DirectionSquared(g, theta, phi);
+        double exp_par = exp(-b * d * direction_2);
+        double perp_scale = (1 - direction_2) * (delta * delta);
+
+        // weights and attenuations for the cylinder radii {1.5, 2.5, 3.5, 4.5, 5.5, 6.5} * 1e-6 meters,
+        // packed in vector types such that the six exp() evaluations map onto SIMD lanes
+        double4 weights_lo = (double4)(0.021184720085574, 0.107169623942214,
+                                       0.194400551313197, 0.266676876170322);
+        double2 weights_hi = (double2)(0.214921653661151, 0.195646574827541);
+
+        double4 signal_perp_lo = perp_scale * (double4)(NeumanCylinderLongApprox(G, TE/2.0, d, 1.5e-6),
+                                                        NeumanCylinderLongApprox(G, TE/2.0, d, 2.5e-6),
+                                                        NeumanCylinderLongApprox(G, TE/2.0, d, 3.5e-6),
+                                                        NeumanCylinderLongApprox(G, TE/2.0, d, 4.5e-6));
+        double2 signal_perp_hi = perp_scale * (double2)(NeumanCylinderLongApprox(G, TE/2.0, d, 5.5e-6),
+                                                        NeumanCylinderLongApprox(G, TE/2.0, d, 6.5e-6));
+
+        return exp_par * (dot(weights_lo, exp(signal_perp_lo)) + dot(weights_hi, exp(signal_perp_hi)));
     '''
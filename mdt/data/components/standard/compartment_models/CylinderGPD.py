@@ -9,9 +9,9 @@ __email__ = "robbert.harms@maastrichtuniversity.nl"
 class CylinderGPD(CompartmentTemplate):
 
     parameters = ('g', 'b', 'G', 'Delta', 'delta', 'd', 'theta', 'phi', 'R')
-    dependencies = ('VanGelderenCylinder', 'SphericalToCartesian')
+    dependencies = ('VanGelderenCylinder', 'DirectionSquared')
     cl_code = '''
-        double direction_2 = pown(dot(g, SphericalToCartesian(theta, phi)), 2);
+        double direction_2 = DirectionSquared(g, theta, phi);
 
         double signal_par = -b * d * direction_2;
         double signal_perp = (1 - direction_2) * VanGelderenCylinder(G, Delta, delta, d, R);
@@ -8,6 +8,14 @@ __email__ = 'robbert.harms@maastrichtuniversity.nl'
 __licence__ = 'LGPL v3'
 
 
+def _axon_density_index(d):
+    """Compute the axon density index, using in-place scaling to limit the number of array temporaries."""
+    index = d['w_ic.w'] / (d['w_ec.w'] + d['w_ic.w'])
+    index *= 4 / np.pi
+    index /= np.square(2 * d['CylinderGPD.R'])
+    return {'AxonDensityIndex': index}
+
+
 class ActiveAx(CompositeModelTemplate):
     """The ActiveAx model for use in in-vivo measurements.
 
@@ -28,10 +36,7 @@ class ActiveAx(CompositeModelTemplate):
              'Zeppelin.dperp0': 'Zeppelin.d * (w_ec.w / (w_ec.w + w_ic.w))',
              'Zeppelin.theta': 'CylinderGPD.theta',
              'Zeppelin.phi': 'CylinderGPD.phi'}
-    extra_optimization_maps = [
-        lambda d: {'AxonDensityIndex': (4 * (d['w_ic.w'] / (d['w_ec.w'] + d['w_ic.w'])))
-                                       / (np.pi * (2 * d['CylinderGPD.R']) ** 2)}
-    ]
+    extra_optimization_maps = [_axon_density_index]
 
 
 class ActiveAx_ExVivo(CompositeModelTemplate):
@@ -59,10 +64,7 @@ class ActiveAx_ExVivo(CompositeModelTemplate):
         'Zeppelin.theta': 'CylinderGPD.theta',
         'Zeppelin.phi': 'CylinderGPD.phi'
     }
-    extra_optimization_maps = [
-        lambda d: {'AxonDensityIndex': (4 * (d['w_ic.w'] / (d['w_ec.w'] + d['w_ic.w'])))
-                                       / (np.pi * (2 * d['CylinderGPD.R']) ** 2)}
-    ]
+    extra_optimization_maps = [_axon_density_index]
 
 
 class TimeDependentActiveAx(CompositeModelTemplate):
@@ -79,7 +81,4 @@ class TimeDependentActiveAx(CompositeModelTemplate):
              'TimeDependentZeppelin.theta': 'CylinderGPD.theta',
              'TimeDependentZeppelin.phi': 'CylinderGPD.phi',
              }
-    extra_optimization_maps = [
-        lambda d: {'AxonDensityIndex': (4 * (d['w_ic.w'] / (d['w_ec.w'] + d['w_ic.w'])))
-                                       / (np.pi * (2 * d['CylinderGPD.R']) ** 2)}
-    ]
+    extra_optimization_maps = [_axon_density_index]
@@ -106,6 +106,32 @@ class TensorSphericalToCartesian(LibraryFunctionTemplate):
     '''
 
 
+class DirectionSquared(LibraryFunctionTemplate):
+    """Compute the squared dot product of the gradient with the (theta, phi) orientation vector.
+
+    Compartments in a composite model often share the same (theta, phi) orientation, for example through
+    the ``fixes`` of models like ActiveAx. By routing this computation through a single function the
+    OpenCL compiler can merge the identical evaluations after inlining, instead of recomputing the
+    spherical to cartesian conversion and dot product per compartment.
+
+    Args:
+        g: the gradient orientation vector
+        theta: polar angle of the orientation
+        phi: azimuth angle of the orientation
+
+    Returns:
+        the squared dot product of g with the unit vector of the given orientation
+    """
+    return_type = 'double'
+    dependencies = ['SphericalToCartesian']
+    parameters = ['float4 g',
+                  'float theta',
+                  'float phi']
+    cl_code = '''
+        return pown(dot(g, SphericalToCartesian(theta, phi)), 2);
+    '''
+
+
 class CartesianPolarDotProduct(LibraryFunctionTemplate):
     """Calculates the dot product between a cartesian and a polar coordinate vector.
 
@@ -1,3 +1,6 @@
+import numpy as np
+from scipy.special import dawsn
+
 from mdt import LibraryFunctionTemplate
 
 __author__ = 'Robbert Harms'
@@ -7,6 +10,96 @@ __email__ = 'robbert.harms@maastrichtuniversity.nl'
 __licence__ = 'LGPL v3'
 
 
+_watson_sh_coeff_lut_size = 2048
+_watson_sh_coeff_lut_log10_min = -2
+_watson_sh_coeff_lut_log10_max = 2
+
+
+def _watson_sh_coeff_table(nmr_entries, log10_kappa_min, log10_kappa_max):
+    """Tabulate the non-constant Watson SH coefficients over a log10(kappa) grid.
+
+    This evaluates the same three-branch closed-form expressions as the exact code in
+    :class:`NODDI_WatsonSHCoeff`, for use as an interpolation table.
+
+    Args:
+        nmr_entries (int): the number of table entries
+        log10_kappa_min (float): the base 10 logarithm of the lowest tabulated kappa
+        log10_kappa_max (float): the base 10 logarithm of the highest tabulated kappa
+
+    Returns:
+        ndarray: matrix of shape (nmr_entries, 6) holding per kappa the SH coefficients of order 2 to 12.
+    """
+    kappa = np.logspace(log10_kappa_min, log10_kappa_max, nmr_entries)
+    table = np.zeros((nmr_entries, 6))
+
+    small = kappa <= 0.1
+    exact = (kappa > 0.1) & (kappa <= 30)
+    large = kappa > 30
+
+    k = kappa[exact]
+    sk = np.sqrt(k)
+    dawsonk = dawsn(sk)
+    ek_ierfik = np.sqrt(np.pi) / (2 * dawsonk)
+
+    table[exact, 0] = (3 * sk - (3 + 2 * k) * dawsonk) * np.sqrt(5.0) * ek_ierfik / k
+    table[exact, 1] = ((105 + 60*k + 12*k**2) * dawsonk
+                       - 105*sk + 10*sk*k) * 0.375 * ek_ierfik / k**2
+    table[exact, 2] = ((-3465 - 1890*k - 420*k**2 - 40*k**3) * dawsonk
+                       + 3465*sk - 420*sk*k + 84*sk*k**2) * np.sqrt(13*np.pi) / 64 / k**3 / dawsonk
+    table[exact, 3] = ((675675 + 360360*k + 83160*k**2 + 10080*k**3 + 560*k**4) * dawsonk
+                       - 675675*sk + 90090*sk*k - 23100*sk*k**2 + 744*sk*k**3) \
+                      * np.sqrt(17.0) * ek_ierfik / 512.0 / k**4
+    table[exact, 4] = ((-43648605 - 22972950*k - 5405400*k**2 - 720720*k**3 - 55440*k**4 - 2016*k**5) * dawsonk
+                       + 43648605*sk - 6126120*sk*k + 1729728*sk*k**2 - 82368*sk*k**3 + 5104*sk*k**4) \
+                      * np.sqrt(21*np.pi) / 4096.0 / k**5 / dawsonk
+    table[exact, 5] = ((7027425405 + 3666482820*k + 872972100*k**2 + 122522400*k**3
+                        + 10810800*k**4 + 576576*k**5 + 14784*k**6) * dawsonk
+                       - 7027425405*sk + 1018467450*sk*k - 302630328*sk*k**2
+                       + 17153136*sk*k**3 - 1553552*sk*k**4 + 25376*sk*k**5) \
+                      * 5 * ek_ierfik / 16384.0 / k**6
+
+    k = kappa[small]
+    table[small, 0] = (4/3.0*k + 8/63.0*k**2) * np.sqrt(np.pi/5.0)
+    table[small, 1] = (8/21.0*k**2 + 32/693.0*k**3) * (np.sqrt(np.pi)*0.2)
+    table[small, 2] = (16/693.0*k**3 + 32/10395.0*k**4) * np.sqrt(np.pi/13)
+    table[small, 3] = (32/19305.0*k**4) * np.sqrt(np.pi/17)
+    table[small, 4] = 64*np.sqrt(np.pi/21)*k**5/692835.0
+    table[small, 5] = 128*np.sqrt(np.pi)*k**6/152108775.0
+
+    lnkd = np.log(kappa[large]) - np.log(30.0)
+    coefficients = [
+        [7.52308, 0.411538, -0.214588, 0.0784091, -0.023981, 0.00731537, -0.0026467],
+        [8.93718, 1.62147, -0.733421, 0.191568, -0.0202906, -0.00779095, 0.00574847],
+        [8.87905, 3.35689, -1.15935, 0.0673053, 0.121857, -0.066642, 0.0180215],
+        [7.84352, 5.03178, -1.0193, -0.426362, 0.328816, -0.0688176, -0.0229398],
+        [6.30113, 6.09914, -0.16088, -1.05578, 0.338069, 0.0937157, -0.106935],
+        [4.65678, 6.30069, 1.13754, -1.38393, -0.0134758, 0.331686, -0.105954]]
+    for ind, row in enumerate(coefficients):
+        table[large, ind] = np.polyval(row[::-1], lnkd)
+
+    return table
+
+
+def _watson_sh_coeff_lut_cl_code():
+    """Generate the CL source of the Watson SH coefficient lookup table."""
+    table = _watson_sh_coeff_table(_watson_sh_coeff_lut_size,
+                                   _watson_sh_coeff_lut_log10_min,
+                                   _watson_sh_coeff_lut_log10_max)
+    rows = ',\n            '.join(', '.join('{:.9g}f'.format(value) for value in row) for row in table)
+    return '''
+        #define NODDI_WATSON_SHCOEFF_LUT_SIZE {size}
+        #define NODDI_WATSON_SHCOEFF_LUT_LOG10_MIN {log10_min}
+        #define NODDI_WATSON_SHCOEFF_LUT_LOG10_MAX {log10_max}
+
+        __constant float noddi_watson_shcoeff_lut[{size} * 6] = {{
+            {rows}
+        }};
+    '''.format(size=_watson_sh_coeff_lut_size,
+               log10_min=float(_watson_sh_coeff_lut_log10_min),
+               log10_max=float(_watson_sh_coeff_lut_log10_max),
+               rows=rows)
+
+
 class NODDI_SphericalHarmonicsIntegral(LibraryFunctionTemplate):
     """Approximate the integral of the Watson distribution using spherical harmonics.
 
@@ -81,10 +174,12 @@ class NODDI_LegendreGaussianIntegral(LibraryFunctionTemplate):
                 
                 This does not work well when x is small
             */
+            double em = exp(-x);
+
             double tmp[NODDI_IC_MAX_POLYNOMIAL_ORDER + 1];
             tmp[0] = sqrt(M_PI) * erf(sqrt(x))/sqrt(x);
             for(int i = 1; i < NODDI_IC_MAX_POLYNOMIAL_ORDER + 1; i++){
-                tmp[i] = (-exp(-x) + (i - 0.5) * tmp[i-1]) / x;
+                tmp[i] = (-em + (i - 0.5) * tmp[i-1]) / x;
             }
             
             // for large enough x
@@ -97,25 +192,33 @@ class NODDI_LegendreGaussianIntegral(LibraryFunctionTemplate):
             result[6] = (231/1024.0)*tmp[0] - (18018/1024.0)*tmp[1] + (225225/1024.0)*tmp[2] - (1021020/1024.0)*tmp[3] + (2078505/1024.0)*tmp[4] - (1939938/1024.0)*tmp[5] + (676039/1024.0)*tmp[6];
         }
         else{
-            // approximate for small x
-            double tmp[NODDI_IC_MAX_POLYNOMIAL_ORDER - 1];
-            tmp[0] = x * x;
-            tmp[1] = tmp[0] * x;
-            tmp[2] = tmp[1] * x;
-            tmp[3] = tmp[2] * x;
-            tmp[4] = tmp[3] * x;
-
-            result[0] = 2 - 2*x/3.0 + tmp[0]/5 - tmp[1]/21.0 + tmp[2]/108.0;
-            result[1] = -4*x/15.0 + 4*tmp[0]/35.0 - 2*tmp[1]/63.0 + 2*tmp[2]/297.0;
-            result[2] = 8*tmp[0]/315.0 - 8*tmp[1]/693.0 + 4*tmp[2]/1287.0;
-            result[3] = -16*tmp[1]/9009.0 + 16*tmp[2]/19305.0;
-            result[4] = 32*tmp[2]/328185.0;
-            result[5] = -64*tmp[3]/14549535.0;
-            result[6] = 128*tmp[4]/760543875.0;
+            // approximate for small x, with the series in Horner form to allow fused multiply-adds
+            double x2 = x * x;
+            double x3 = x2 * x;
+            double x4 = x2 * x2;
+
+            result[0] = 2 + x*(-2/3.0 + x*(1/5.0 + x*(-1/21.0 + x*(1/108.0))));
+            result[1] = x*(-4/15.0 + x*(4/35.0 + x*(-2/63.0 + x*(2/297.0))));
+            result[2] = x2*(8/315.0 + x*(-8/693.0 + x*(4/1287.0)));
+            result[3] = x3*(-16/9009.0 + x*(16/19305.0));
+            result[4] = x4*(32/328185.0);
+            result[5] = x4*x*(-64/14549535.0);
+            result[6] = x4*x2*(128/760543875.0);
         }
     '''
 
 
+class NODDI_WatsonSHCoeffLUT(LibraryFunctionTemplate):
+    """Lookup table with the spherical harmonic coefficients of the Watson's distribution.
+
+    This tabulates the order 2 to 12 coefficients computed by :class:`NODDI_WatsonSHCoeff` (the order 0
+    coefficient is a constant), sampled uniformly in log10(kappa). The sampled range covers the
+    defined range of the kappa parameter.
+    """
+    is_function = False
+    cl_code = _watson_sh_coeff_lut_cl_code()
+
+
 class NODDI_WatsonSHCoeff(LibraryFunctionTemplate):
     """Computes the spherical harmonic (SH) coefficients of the Watson's distribution up to the 12th order.
 
@@ -126,6 +229,11 @@ class NODDI_WatsonSHCoeff(LibraryFunctionTemplate):
 
     Note that the SH coefficients of the odd orders are always zero and are therefore not returned.
 
+    By default this interpolates the coefficients linearly from a table precomputed over log10(kappa),
+    which replaces the transcendental function calls of the closed-form expressions by a single table
+    lookup per coefficient. Define ``NODDI_WATSON_SHCOEFF_EXACT`` in the kernel to use the closed-form
+    evaluation instead, for example for validating the table.
+
     Args:
         kappa: the concentration parameter of the NODDI model
         result: vector with 7 elements, for the spherical harmonic coefficients up to order 12
@@ -138,13 +246,27 @@ class NODDI_WatsonSHCoeff(LibraryFunctionTemplate):
     """
     parameters = ['double kappa',
                   'double* result']
-    dependencies = ('erfi',)
+    dependencies = ('dawson', 'NODDI_WatsonSHCoeffLUT')
     cl_code = '''
         // do not change this value! It would require adding approximations
         #define NODDI_IC_MAX_POLYNOMIAL_ORDER 6
 
         result[0] = sqrt(M_PI) * 2;
 
+        #ifndef NODDI_WATSON_SHCOEFF_EXACT
+        double pos = (log10(kappa) - NODDI_WATSON_SHCOEFF_LUT_LOG10_MIN)
+                        / (NODDI_WATSON_SHCOEFF_LUT_LOG10_MAX - NODDI_WATSON_SHCOEFF_LUT_LOG10_MIN)
+                        * (NODDI_WATSON_SHCOEFF_LUT_SIZE - 1);
+        pos = clamp(pos, 0.0, (double)(NODDI_WATSON_SHCOEFF_LUT_SIZE - 1));
+
+        int lut_ind = min((int)pos, NODDI_WATSON_SHCOEFF_LUT_SIZE - 2);
+        double weight = pos - lut_ind;
+
+        for(int i = 0; i < NODDI_IC_MAX_POLYNOMIAL_ORDER; i++){
+            result[i + 1] = (1 - weight) * noddi_watson_shcoeff_lut[lut_ind * 6 + i]
+                                + weight * noddi_watson_shcoeff_lut[(lut_ind + 1) * 6 + i];
+        }
+        #else
         if(kappa <= 30){
             double ks[NODDI_IC_MAX_POLYNOMIAL_ORDER - 1];
             ks[0] = kappa * kappa;
@@ -163,45 +285,43 @@ class NODDI_WatsonSHCoeff(LibraryFunctionTemplate):
                 sks[4] = sks[3] * kappa;
                 sks[5] = sks[4] * kappa;
 
-                double erfik = erfi(sks[0]);
-                double ierfik = 1/erfik;
-                double ek = exp(kappa);
-                double dawsonk = sqrt(M_PI)/2 * erfik/ek;
+                double dawsonk = dawson(sks[0]);
+                double inv_dawson = 1.0/dawsonk;
+
+                // exp(kappa)/erfi(sqrt(kappa)), using erfi(x) = 2/sqrt(pi) * exp(x^2) * dawson(x)
+                double ek_ierfik = sqrt(M_PI)/2.0 * inv_dawson;
 
                 result[1] = 3 * sks[0] - (3 + 2 * kappa) * dawsonk;
-                result[1] = sqrt(5.0) * result[1] * ek;
-                result[1] = result[1]*ierfik/kappa;
+                result[1] = sqrt(5.0) * result[1] * ek_ierfik;
+                result[1] = result[1]/kappa;
 
                 result[2] = (105 + 60*kappa + 12*ks[0] )*dawsonk;
                 result[2] = result[2] -105*sks[0] + 10*sks[1];
-                result[2] = .375*result[2]*ek/ks[0];
-                result[2] = result[2]*ierfik;
+                result[2] = .375*result[2]*ek_ierfik/ks[0];
 
                 result[3] = -3465 - 1890*kappa - 420*ks[0]  - 40*ks[1] ;
                 result[3] = result[3]*dawsonk;
                 result[3] = result[3] + 3465*sks[0] - 420*sks[1]  + 84*sks[2];
                 result[3] = result[3]*sqrt(13*M_PI_F)/64/ks[1];
-                result[3] = result[3]/dawsonk;
+                result[3] = result[3]*inv_dawson;
 
                 result[4] = 675675 + 360360*kappa + 83160*ks[0]  + 10080*ks[1]  + 560*ks[2] ;
                 result[4] = result[4]*dawsonk;
                 result[4] = result[4] - 675675*sks[0] + 90090*sks[1]  - 23100*sks[2]  + 744*sks[3];
-                result[4] = sqrt(17.0)*result[4]*ek;
+                result[4] = sqrt(17.0)*result[4]*ek_ierfik;
                 result[4] = result[4]/512.0/ks[2];
-                result[4] = result[4]*ierfik;
 
                 result[5] = -43648605 - 22972950*kappa - 5405400*ks[0]  - 720720*ks[1]  - 55440*ks[2]  - 2016*ks[3];
                 result[5] = result[5]*dawsonk;
                 result[5] = result[5] + 43648605*sks[0] - 6126120*sks[1]  + 1729728*sks[2]  - 82368*sks[3]  + 5104*sks[4];
                 result[5] = sqrt(21*M_PI_F)*result[5]/4096.0/ks[3];
-                result[5] = result[5]/dawsonk;
+                result[5] = result[5]*inv_dawson;
 
                 result[6] = 7027425405 + 3666482820*kappa + 872972100*ks[0]  + 122522400*ks[1]   + 10810800*ks[2]  + 576576*ks[3]  + 14784*ks[4];
                 result[6] = result[6]*dawsonk;
                 result[6] = result[6] - 7027425405*sks[0] + 1018467450*sks[1]  - 302630328*sks[2]  + 17153136*sks[3]  - 1553552*sks[4]  + 25376*sks[5];
-                result[6] = 5*result[6]*ek;
+                result[6] = 5*result[6]*ek_ierfik;
                 result[6] = result[6]/16384.0/ks[4];
-                result[6] = result[6]*ierfik;
             }
             else{
                 // approximate
@@ -230,6 +350,7 @@ class NODDI_WatsonSHCoeff(LibraryFunctionTemplate):
             result[5] = 6.30113 + 6.09914*lnkd[0] - 0.16088*lnkd[1] - 1.05578*lnkd[2] + 0.338069*lnkd[3] + 0.0937157*lnkd[4] - 0.106935*lnkd[5];
             result[6] = 4.65678 + 6.30069*lnkd[0] + 1.13754*lnkd[1] - 1.38393*lnkd[2] - 0.0134758*lnkd[3] + 0.331686*lnkd[4] - 0.105954*lnkd[5];
         }
+        #endif // NODDI_WATSON_SHCOEFF_EXACT
     '''
 
 
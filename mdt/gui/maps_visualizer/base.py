@@ -1,3 +1,5 @@
+from collections import deque
+
 from PyQt5.QtCore import QObject, pyqtSignal
 from mdt.visualization.maps.base import MapPlotConfig, SimpleDataInfo
 
@@ -104,8 +106,8 @@ class QtController(Controller, QObject):
     def __init__(self):
         super().__init__()
         self._current_model = SimpleDataConfigModel(SimpleDataInfo({}), MapPlotConfig())
-        self._actions_history = []
-        self._redoable_actions = []
+        self._actions_history = deque(maxlen=128)
+        self._redoable_actions = deque(maxlen=128)
 
     def set_data(self, data_info, config=None):
         config = config or MapPlotConfig()
@@ -121,8 +123,8 @@ class QtController(Controller, QObject):
 
         config.maps_to_show = list(filter(lambda k: k in data_info.get_map_names(), config.maps_to_show))
 
-        self._actions_history = []
-        self._redoable_actions = []
+        self._actions_history.clear()
+        self._redoable_actions.clear()
         self.model_updated.emit(self._current_model)
 
     def get_model(self):
@@ -134,7 +136,7 @@ class QtController(Controller, QObject):
         if is_applied:
             if store_in_history:
                 self._actions_history.append(action)
-                self._redoable_actions = []
+                self._redoable_actions.clear()
             self.model_updated.emit(self._current_model)
 
     def undo(self):
@@ -15,6 +15,8 @@ __email__ = "robbert.harms@maastrichtuniversity.nl"
 
 class TabTextual(QWidget, Ui_TabTextual):
 
+    _tab_translation = str.maketrans({'\t': ' ' * 4})
+
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.setupUi(self)
@@ -29,21 +31,40 @@ class TabTextual(QWidget, Ui_TabTextual):
 
         self._flags = {'updating_config_from_string': False,
                        'toggling_view_selection': False}
+        self._displayed_config = None
 
     @pyqtSlot(DataConfigModel)
     def set_new_model(self, model):
-        with blocked_signals(self.textConfigEdit):
-            if not self._flags['updating_config_from_string']:
-                non_default_only = self.viewSelectedOptions.isChecked()
-                self.textConfigEdit.setPlainText(model.get_config().to_yaml(non_default_only=non_default_only))
-                self._update_status_indication(True)
+        non_default_only = self.viewSelectedOptions.isChecked()
+        if self._flags['updating_config_from_string']:
+            # the editor shows the text the user typed; only record the config it represents
+            self._displayed_config = (model.get_config(), non_default_only)
+        else:
+            with blocked_signals(self.textConfigEdit):
+                self._set_config_text(model.get_config(), non_default_only)
 
     @pyqtSlot()
     def _toggle_viewed_options(self):
         self._flags['toggling_view_selection'] = True
         non_default_only = self.viewSelectedOptions.isChecked()
         current_model = self._controller.get_model()
-        self.textConfigEdit.setPlainText(current_model.get_config().to_yaml(non_default_only=non_default_only))
+        self._set_config_text(current_model.get_config(), non_default_only, force=True)
+
+    def _set_config_text(self, config, non_default_only, force=False):
+        """Display the given configuration as YAML in the text editor.
+
+        If the configuration to display equals the one currently displayed we skip both the YAML dump
+        and the text widget update, since model updates are broadcast more often than the config changes.
+
+        Args:
+            config (mdt.visualization.maps.base.MapPlotConfig): the configuration to display
+            non_default_only (boolean): if we only want to display the non-default options
+            force (boolean): if set, update the text even if the configuration did not change
+        """
+        if not force and self._displayed_config == (config, non_default_only):
+            return
+        self._displayed_config = (config, non_default_only)
+        self.textConfigEdit.setPlainText(config.to_yaml(non_default_only=non_default_only))
         self._update_status_indication(True)
 
     @pyqtSlot(str)
@@ -53,7 +74,7 @@ class TabTextual(QWidget, Ui_TabTextual):
             return
 
         self._flags['updating_config_from_string'] = True
-        text = text.replace('\t', ' '*4)
+        text = text.translate(self._tab_translation)
         try:
             if text.strip() != '':
                 current_model = self._controller.get_model()
@@ -4,9 +4,6 @@ import os
 import signal
 from textwrap import dedent
 
-import matplotlib
-matplotlib.use('Qt5Agg')
-
 import yaml
 from PyQt5.QtCore import QTimer
 from PyQt5.QtCore import pyqtSlot
@@ -30,7 +27,6 @@ from mdt.gui.maps_visualizer.base import DataConfigModel, \
 from mdt.gui.maps_visualizer.renderers.base import PlottingFrameInfoViewer
 from mdt.visualization.maps.base import DataInfo, SimpleDataInfo, MapPlotConfig
 from mdt.visualization.maps.utils import get_shortest_unique_names
-from mdt.gui.maps_visualizer.renderers.matplotlib_renderer import MatplotlibPlotting
 from mdt.gui.model_fit.design.ui_about_dialog import Ui_AboutDialog
 from mdt.gui.utils import center_window, QtManager, get_script_file_header_text, image_files_filters, \
     enable_pyqt_exception_hook
@@ -58,6 +54,10 @@ class MapsVisualizerWindow(QMainWindow, Ui_MapsVisualizer):
         self.statusBar().addPermanentWidget(self._coordinates_label)
         self.statusBar().setStyleSheet("QStatusBar::item { border: 0px solid black }; ")
 
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from mdt.gui.maps_visualizer.renderers.matplotlib_renderer import MatplotlibPlotting
+
         self.plotting_info_to_statusbar = PlottingFrameInfoToStatusBar(self._controller, self._coordinates_label)
         self.plotting_frame = MatplotlibPlotting(controller, parent=parent,
                                                  plotting_info_viewer=self.plotting_info_to_statusbar)
@@ -176,8 +176,9 @@ class FitModelTab(MainTab, Ui_FitModelTabContent, QObject):
         model_name = self._get_current_model_name()
         model = mdt.get_model(model_name)()
 
-        if not model.is_input_data_sufficient(self._input_data_info.build_input_data()):
-            msg = ProtocolWarningBox(model.get_input_data_problems(self._input_data_info.build_input_data()))
+        input_data_problems = model.get_input_data_problems(self._input_data_info.build_input_data())
+        if input_data_problems:
+            msg = ProtocolWarningBox(input_data_problems)
             msg.exec_()
             return
 
@@ -1,7 +1,6 @@
 import glob
 import gzip
 import os
-import copy
 import nibabel as nib
 import numpy as np
 import shutil
@@ -106,7 +105,7 @@ def write_nifti(data, output_fname, header=None, affine=None, use_data_dtype=Tru
         header = nib.nifti2.Nifti2Header()
 
     if use_data_dtype:
-        header = copy.deepcopy(header)
+        header = header.copy()
         dtype = data.dtype
         if data.dtype == np.bool:
             dtype = np.char
@@ -118,8 +117,7 @@ def write_nifti(data, output_fname, header=None, affine=None, use_data_dtype=Tru
     if not (output_fname.endswith('.nii.gz') or output_fname.endswith('.nii')):
         output_fname += '.nii.gz'
 
-    if not os.path.exists(os.path.dirname(output_fname)):
-        os.makedirs(os.path.dirname(output_fname))
+    os.makedirs(os.path.dirname(output_fname), exist_ok=True)
 
     if isinstance(header, nib.nifti2.Nifti2Header):
         format = nib.Nifti2Image
@@ -230,8 +228,7 @@ def unzip_nifti(input_filename, output_filename):
     Raises:
         ValueError: if the extensions of either the input or output filename are not correct.
     """
-    if not os.path.exists(os.path.dirname(output_filename)):
-        os.makedirs(os.path.dirname(output_filename))
+    os.makedirs(os.path.dirname(output_filename), exist_ok=True)
 
     if not input_filename.rstrip().endswith('.gz') or not output_filename.rstrip().endswith('.nii'):
         raise ValueError('The input filename should have extension ".gz" and the '
@@ -623,17 +623,28 @@ class DKIMeasures:
 
 class NODDIMeasures:
 
+    @staticmethod
+    def _watson_odi(kappa):
+        """Compute the Watson orientation dispersion index in a single pass over the kappa values.
+
+        By scaling the arctan2 result in-place we avoid allocating intermediate arrays for these
+        voxel-sized computations.
+        """
+        odi = np.arctan2(1.0, kappa)
+        odi *= 2 / np.pi
+        return odi
+
     @staticmethod
     def noddi_watson_extra_optimization_maps(results):
         """Computes the NDI and ODI for the NODDI Watson model"""
         return {'NDI': results['w_ic.w'] / (results['w_ic.w'] + results['w_ec.w']),
-                'ODI': np.arctan2(1.0, results['NODDI_IC.kappa']) * 2 / np.pi}
+                'ODI': NODDIMeasures._watson_odi(results['NODDI_IC.kappa'])}
 
     @staticmethod
     def noddi_watson_extra_sampling_maps(results):
         """Computes the NDI and ODI per sample and average over the derived values."""
         ndi = results['w_ic.w'] / (results['w_ic.w'] + results['w_ec.w'])
-        odi = np.arctan2(1.0, results['NODDI_IC.kappa']) * 2 / np.pi
+        odi = NODDIMeasures._watson_odi(results['NODDI_IC.kappa'])
 
         return {'NDI': np.mean(ndi, axis=1), 'NDI.std': np.std(ndi, axis=1),
                 'ODI': np.mean(odi, axis=1), 'ODI.std': np.std(odi, axis=1)}
@@ -6,7 +6,6 @@ import logging
 import os
 import shutil
 import time
-import timeit
 from contextlib import contextmanager
 import mot
 from mdt.__version__ import __version__
@@ -72,10 +71,15 @@ def get_optimization_inits(model_name, input_data, output_folder, cl_device_ind=
     """
     logger = logging.getLogger(__name__)
 
+    fit_results_cache = {}
+
     def get_subset(param_names, fit_results):
         return {key: value for key, value in fit_results.items() if key in param_names}
 
     def get_model_fit(model_name):
+        if model_name in fit_results_cache:
+            return fit_results_cache[model_name]
+
         logger.info('Starting intermediate optimization for generating initialization point.')
 
         inits = get_init_data(model_name)
@@ -86,6 +90,7 @@ def get_optimization_inits(model_name, input_data, output_folder, cl_device_ind=
                             cl_device_ind=cl_device_ind, initialization_data={'inits': inits})
 
         logger.info('Finished intermediate optimization for generating initialization point.')
+        fit_results_cache[model_name] = results
         return results
 
     def get_init_data(model_name):
@@ -198,10 +203,11 @@ def get_batch_fitting_function(total_nmr_subjects, models_to_fit, output_folder,
 
     @contextmanager
     def timer(subject_id):
-        start_time = timeit.default_timer()
+        start_time = time.perf_counter()
         yield
-        logger.info('Fitted all models on subject {0} in time {1} (h:m:s)'.format(
-            subject_id, time.strftime('%H:%M:%S', time.gmtime(timeit.default_timer() - start_time))))
+        run_time = int(time.perf_counter() - start_time)
+        logger.info('Fitted all models on subject {0} in time {1:02d}:{2:02d}:{3:02d} (h:m:s)'.format(
+            subject_id, run_time // 3600, (run_time % 3600) // 60, run_time % 60))
 
     class FitFunc:
 
@@ -269,10 +275,11 @@ def fit_composite_model(model, input_data, output_folder, method, tmp_results_di
     logger = logging.getLogger(__name__)
     output_path = os.path.join(output_folder, model.name)
 
-    if not model.is_input_data_sufficient(input_data):
+    input_data_problems = model.get_input_data_problems(input_data)
+    if input_data_problems:
         raise InsufficientProtocolError(
             'The given protocol is insufficient for this model. '
-            'The reported errors where: {}'.format(model.get_input_data_problems(input_data)))
+            'The reported errors where: {}'.format(input_data_problems))
 
     if not recalculate and model_output_exists(model, output_folder):
         maps = get_all_nifti_data(output_path)
@@ -291,8 +298,7 @@ def fit_composite_model(model, input_data, output_folder, method, tmp_results_di
                 if os.path.exists(os.path.join(output_path + 'covariances')):
                     shutil.rmtree(os.path.join(output_path + 'covariances'))
 
-        if not os.path.exists(output_path):
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         with _model_fit_logging(logger, model.name, model.get_free_param_names()):
             tmp_dir = get_intermediate_results_path(output_path, tmp_results_dir)
@@ -309,17 +315,18 @@ def fit_composite_model(model, input_data, output_folder, method, tmp_results_di
 @contextmanager
 def _model_fit_logging(logger, model_name, free_param_names):
     """Adds logging information around the processing."""
-    def calculate_run_days(runtime):
-        if runtime > 24 * 60 * 60:
-            return int(runtime // (24. * 60 * 60))
-        return 0
+    def format_run_time(runtime):
+        days, remainder = divmod(int(runtime), 24 * 60 * 60)
+        hours, remainder = divmod(remainder, 60 * 60)
+        minutes, seconds = divmod(remainder, 60)
+        return '{}:{:02d}:{:02d}:{:02d}'.format(days, hours, minutes, seconds)
 
-    minimize_start_time = timeit.default_timer()
+    start_time = time.perf_counter()
     logger.info('Fitting {} model'.format(model_name))
     logger.info('The {} parameters we will fit are: {}'.format(len(free_param_names), free_param_names))
     yield
-    run_time = timeit.default_timer() - minimize_start_time
-    run_time_str = str(calculate_run_days(run_time)) + ':' + time.strftime('%H:%M:%S', time.gmtime(run_time))
+    run_time = time.perf_counter() - start_time
+    run_time_str = format_run_time(run_time)
     logger.info('Fitted {0} model with runtime {1} (d:h:m:s).'.format(model_name, run_time_str))
 
 
@@ -3,7 +3,6 @@ import shutil
 from contextlib import contextmanager
 import logging
 import os
-import timeit
 import time
 import numpy as np
 from numpy.lib.format import open_memmap
@@ -78,24 +77,23 @@ def sample_composite_model(model, input_data, output_folder, nmr_samples, thinni
     else:
         samples_storage_strategy = SaveNoSamples()
 
-    if not model.is_input_data_sufficient(input_data):
+    input_data_problems = model.get_input_data_problems(input_data)
+    if input_data_problems:
         raise InsufficientProtocolError(
             'The provided protocol is insufficient for this model. '
-            'The reported errors where: {}'.format(model.get_input_data_problems(input_data)))
+            'The reported errors where: {}'.format(input_data_problems))
 
-    if not os.path.isdir(output_folder):
-        os.makedirs(output_folder)
+    os.makedirs(output_folder, exist_ok=True)
 
     if recalculate:
         shutil.rmtree(output_folder)
     else:
-        if os.path.exists(os.path.join(output_folder, 'UsedMask.nii.gz')) \
-                or os.path.exists(os.path.join(output_folder, 'UsedMask.nii')):
+        used_mask_path = os.path.join(output_folder, 'UsedMask')
+        if os.path.exists(used_mask_path + '.nii.gz') or os.path.exists(used_mask_path + '.nii'):
             logger.info('Not recalculating {} model'.format(model.name))
             return load_samples(output_folder)
 
-    if not os.path.isdir(output_folder):
-        os.makedirs(output_folder)
+    os.makedirs(output_folder, exist_ok=True)
 
     model.set_input_data(input_data)
 
@@ -115,16 +113,17 @@ def sample_composite_model(model, input_data, output_folder, nmr_samples, thinni
 
 @contextmanager
 def _log_info(logger, model_name):
-    def calculate_run_days(runtime):
-        if runtime > 24 * 60 * 60:
-            return int(runtime // (24. * 60 * 60))
-        return 0
+    def format_run_time(runtime):
+        days, remainder = divmod(int(runtime), 24 * 60 * 60)
+        hours, remainder = divmod(remainder, 60 * 60)
+        minutes, seconds = divmod(remainder, 60)
+        return '{}:{:02d}:{:02d}:{:02d}'.format(days, hours, minutes, seconds)
 
-    minimize_start_time = timeit.default_timer()
+    start_time = time.perf_counter()
     logger.info('Sampling {} model'.format(model_name))
     yield
-    run_time = timeit.default_timer() - minimize_start_time
-    run_time_str = str(calculate_run_days(run_time)) + ':' + time.strftime('%H:%M:%S', time.gmtime(run_time))
+    run_time = time.perf_counter() - start_time
+    run_time_str = format_run_time(run_time)
     logger.info('Sampled {0} model with runtime {1} (d:h:m:s).'.format(model_name, run_time_str))
 
 
@@ -272,8 +271,7 @@ class SamplingProcessor(SimpleModelProcessor):
             results (dict): the samples to write
             roi_indices (ndarray): the roi indices of the voxels we computed
         """
-        if not os.path.exists(self._output_dir):
-            os.makedirs(self._output_dir)
+        os.makedirs(self._output_dir, exist_ok=True)
 
         for fname in os.listdir(self._output_dir):
             if fname.endswith('.samples.npy'):
@@ -11,7 +11,6 @@ import glob
 import logging
 import os
 import shutil
-import timeit
 from contextlib import contextmanager
 import numpy as np
 import time
@@ -132,7 +131,7 @@ class ChunksProcessingStrategy(ModelProcessingStrategy):
 
         batches = []
         if len(total_roi_indices):
-            start_time = timeit.default_timer()
+            start_time = time.perf_counter()
             start_nmr_processed = (total_nmr_voxels - len(total_roi_indices))
 
             mot_logging_enabled = True
@@ -177,21 +176,21 @@ class ChunksProcessingStrategy(ModelProcessingStrategy):
                                  start_nmr_processed):
         total_processed = (total_nmr_voxels - len(voxels_to_process)) + voxels_processed
 
-        def calculate_run_days(runtime):
-            if runtime > 24 * 60 * 60:
-                return int(runtime // (24. * 60 * 60))
-            return 0
+        def format_run_time(runtime):
+            days, remainder = divmod(int(runtime), 24 * 60 * 60)
+            hours, remainder = divmod(remainder, 60 * 60)
+            minutes, seconds = divmod(remainder, 60)
+            return '{}:{:02d}:{:02d}:{:02d}'.format(days, hours, minutes, seconds)
 
-        run_time = timeit.default_timer() - start_time
+        run_time = time.perf_counter() - start_time
         current_percentage = voxels_processed / (total_nmr_voxels - start_nmr_processed)
         if current_percentage > 0:
             remaining_time = (run_time / current_percentage) - run_time
         else:
             remaining_time = None
 
-        run_time_str = str(calculate_run_days(run_time)) + ':' + time.strftime('%H:%M:%S', time.gmtime(run_time))
-        remaining_time_str = (str(calculate_run_days(remaining_time)) + ':' +
-                              time.strftime('%H:%M:%S', time.gmtime(remaining_time))) if remaining_time else '?'
+        run_time_str = format_run_time(run_time)
+        remaining_time_str = format_run_time(remaining_time) if remaining_time else '?'
 
         return ('Computations are at {0:.2%}, processing next {1} voxels ('
                 '{2} voxels in total, {3} processed). Time spent: {4}, time left: {5} (d:h:m:s).'.
@@ -303,8 +302,7 @@ class SimpleModelProcessor(ModelProcessor):
             if os.path.exists(tmp_storage_dir):
                 shutil.rmtree(tmp_storage_dir)
 
-        if not os.path.exists(tmp_storage_dir):
-            os.makedirs(tmp_storage_dir)
+        os.makedirs(tmp_storage_dir, exist_ok=True)
 
     def _write_volumes(self, results, roi_indices, tmp_dir):
         """Write the result arrays to the temporary storage
@@ -314,8 +312,7 @@ class SimpleModelProcessor(ModelProcessor):
             roi_indices (ndarray): the indices of the voxels we computed
             tmp_dir (str): the directory to save the intermediate results to
         """
-        if not os.path.exists(tmp_dir):
-            os.makedirs(tmp_dir)
+        os.makedirs(tmp_dir, exist_ok=True)
 
         volume_indices = self._volume_indices[roi_indices, :]
 
@@ -363,8 +360,7 @@ class SimpleModelProcessor(ModelProcessor):
             dict: the dictionary with the ROIs for every volume, by parameter name
         """
         full_output_dir = os.path.join(output_dir, maps_subdir)
-        if not os.path.exists(full_output_dir):
-            os.makedirs(full_output_dir)
+        os.makedirs(full_output_dir, exist_ok=True)
 
         for fname in os.listdir(full_output_dir):
             if fname.endswith('.nii.gz'):
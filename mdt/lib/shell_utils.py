@@ -4,8 +4,6 @@ import textwrap
 import argcomplete
 import sys
 
-import mdt
-
 __author__ = 'Robbert Harms'
 __date__ = "2015-10-16"
 __maintainer__ = "Robbert Harms"
@@ -39,7 +37,6 @@ class BasicShellApplication:
 
     def __init__(self):
         self.parse_unknown_args = False
-        mdt.init_user_settings(pass_if_exists=True)
 
     @classmethod
     def console_script(cls):
@@ -60,10 +57,13 @@ class BasicShellApplication:
 
         if self.parse_unknown_args:
             args, unknown = parser.parse_known_args(run_args)
-            self.run(args, unknown)
         else:
-            args = parser.parse_args(run_args)
-            self.run(args, {})
+            args, unknown = parser.parse_args(run_args), {}
+
+        import mdt
+        mdt.init_user_settings(pass_if_exists=True)
+
+        self.run(args, unknown)
 
     def run(self, args, extra_args):
         """Run the application with the given arguments.
@@ -165,15 +165,14 @@ def sort_volumes_per_voxel(input_volumes, sort_matrix):
     input_volumes = load_maps(input_volumes)
 
     if input_volumes[0].shape[3] > 1:
-        volume = np.concatenate([np.reshape(m, m.shape[0:3] + (1,) + (m.shape[3],)) for m in input_volumes], axis=3)
+        volume = np.concatenate([m[:, :, :, None, :] for m in input_volumes], axis=3)
         grid = np.ogrid[[slice(x) for x in volume.shape]]
-        sorted_volume = volume[list(grid[:-2]) + [np.reshape(sort_matrix, sort_matrix.shape + (1,))] + list(grid[-1])]
+        sorted_volume = volume[list(grid[:-2]) + [sort_matrix[..., None]] + list(grid[-1])]
         return [sorted_volume[..., ind, :] for ind in range(len(input_volumes))]
     else:
         volume = np.concatenate([m for m in input_volumes], axis=3)
         sorted_volume = volume[list(np.ogrid[[slice(x) for x in volume.shape]][:-1])+[sort_matrix]]
-        return [np.reshape(sorted_volume[..., ind], sorted_volume.shape[0:3] + (1,))
-                for ind in range(len(input_volumes))]
+        return [sorted_volume[..., ind, None] for ind in range(len(input_volumes))]
 
 
 def undo_sort_volumes_per_voxel(input_volumes, sort_matrix):
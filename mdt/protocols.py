@@ -37,6 +37,7 @@ class Protocol(collections.Mapping):
         super().__init__()
         self._gamma_h = 267.5987E6 # radians s^-1 T^-1 (s = seconds, T = Tesla)
         self._unweighted_threshold = 25e6 # s/m^2
+        self._index_cache = {}
         self._columns = {}
         self._preferred_column_order = ('gx', 'gy', 'gz', 'G', 'Delta', 'delta', 'TE', 'T1', 'b', 'q', 'maxG')
         self._virtual_columns = [VirtualColumnB(),
@@ -338,13 +339,16 @@ class Protocol(collections.Mapping):
                 clustered_shells.append(new_shell)
             return clustered_shells
 
-        clusters = cluster_b_values(np.sort(np.squeeze(self.get_column('b')[self.get_weighted_indices()])))
+        cache_key = ('b_values_shells', width)
+        if cache_key not in self._index_cache:
+            clusters = cluster_b_values(np.sort(np.squeeze(self.get_column('b')[self.get_weighted_indices()])))
 
-        cluster_info = []
-        for cluster in clusters:
-            cluster_info.append({'b_value': np.mean(cluster), 'nmr_volumes': len(cluster)})
+            cluster_info = []
+            for cluster in clusters:
+                cluster_info.append({'b_value': np.mean(cluster), 'nmr_volumes': len(cluster)})
 
-        return cluster_info
+            self._index_cache[cache_key] = cluster_info
+        return self._index_cache[cache_key]
 
     def has_column(self, column_name):
         """Check if this protocol has a column with the given name.
@@ -385,12 +389,16 @@ class Protocol(collections.Mapping):
         """
         unweighted_threshold = unweighted_threshold or self._unweighted_threshold
 
-        try:
-            b = self.get_column('b')
-            g = self.get_column('g')
-            return np.where(np.sqrt(g[:, 0] ** 2 + g[:, 1] ** 2 + g[:, 2] ** 2) * b[:, 0] < unweighted_threshold)[0]
-        except KeyError:
-            return range(self.length)
+        cache_key = ('unweighted_indices', unweighted_threshold)
+        if cache_key not in self._index_cache:
+            try:
+                b = self.get_column('b')
+                g = self.get_column('g')
+                self._index_cache[cache_key] = np.where(
+                    np.sqrt(g[:, 0] ** 2 + g[:, 1] ** 2 + g[:, 2] ** 2) * b[:, 0] < unweighted_threshold)[0]
+            except KeyError:
+                self._index_cache[cache_key] = range(self.length)
+        return self._index_cache[cache_key]
 
     def get_weighted_indices(self, unweighted_threshold=None):
         """Get the indices to the weighted volumes.
@@ -401,8 +409,12 @@ class Protocol(collections.Mapping):
         Returns:
             list of int: A list of indices to the weighted volumes.
         """
-        return sorted(set(range(self.get_column('b').shape[0])) -
-                      set(self.get_unweighted_indices(unweighted_threshold=unweighted_threshold)))
+        cache_key = ('weighted_indices', unweighted_threshold)
+        if cache_key not in self._index_cache:
+            self._index_cache[cache_key] = sorted(
+                set(range(self.get_column('b').shape[0])) -
+                set(self.get_unweighted_indices(unweighted_threshold=unweighted_threshold)))
+        return self._index_cache[cache_key]
 
     def get_indices_bval_in_range(self, start=0, end=1.0e9):
         """Get the indices of the b-values in the range [start, end].
@@ -1,5 +1,5 @@
 import numpy as np
-import collections
+import collections.abc
 from mdt.lib.components import get_model
 from mdt.lib.nifti import get_all_nifti_data
 from mdt.utils import create_roi, restore_volumes
@@ -73,7 +73,7 @@ def simulate_signals(model, protocol, parameters):
 
     model.set_input_data(MockMRIInputData(protocol=protocol))
 
-    if isinstance(parameters, collections.Mapping):
+    if isinstance(parameters, collections.abc.Mapping):
         parameters = model.param_dict_to_array(parameters)
 
     nmr_problems = parameters.shape[0]
@@ -102,10 +102,18 @@ def add_rician_noise(signals, noise_level, seed=None):
     Returns:
         ndarray: make every element of the input signals contain Rician distributed noise.
     """
-    random_state = np.random.RandomState(seed)
-    x = noise_level * random_state.normal(size=signals.shape) + signals
-    y = noise_level * random_state.normal(size=signals.shape)
-    return np.sqrt(x**2, y**2).astype(signals.dtype)
+    rng = np.random.default_rng(seed)
+
+    noise_dtype = signals.dtype if signals.dtype in (np.float32, np.float64) else np.float64
+
+    x = rng.standard_normal(signals.shape, dtype=noise_dtype)
+    x *= noise_level
+    x += signals
+
+    y = rng.standard_normal(signals.shape, dtype=noise_dtype)
+    y *= noise_level
+
+    return np.hypot(x, y, out=x).astype(signals.dtype, copy=False)
 
 
 def _get_simulate_function(model):
@@ -435,15 +435,18 @@ def create_roi(data, brain_mask):
             return_val = np.expand_dims(return_val, axis=1)
         return return_val
 
-    if isinstance(data, (dict, collections.Mapping)):
-        return DeferredActionDict(lambda _, item: create_roi(item, brain_mask), data)
-    elif isinstance(data, str):
-        if os.path.isdir(data):
-            return create_roi(load_volume_maps(data), brain_mask)
-        return creator(load_nifti(data).get_data())
-    elif isinstance(data, (list, tuple, collections.Sequence)):
-        return DeferredActionTuple(lambda _, item: create_roi(item, brain_mask), data)
-    return creator(data)
+    def create(data):
+        if isinstance(data, (dict, collections.Mapping)):
+            return DeferredActionDict(lambda _, item: create(item), data)
+        elif isinstance(data, str):
+            if os.path.isdir(data):
+                return create(load_volume_maps(data))
+            return creator(load_nifti(data).get_data())
+        elif isinstance(data, (list, tuple, collections.Sequence)):
+            return DeferredActionTuple(lambda _, item: create(item), data)
+        return creator(data)
+
+    return create(data)
 
 
 def restore_volumes(data, brain_mask, with_volume_dim=True):
@@ -882,11 +885,17 @@ def flatten(input_it):
                 yield j
 
 
+_cl_devices_cache = {}
+
+
 def get_cl_devices(indices=None, device_type=None):
     """Get a list of all CL devices in the system.
 
     The indices of the devices can be used in the model fitting/sample functions for 'cl_device_ind'.
 
+    Since the devices in the system do not change during the lifetime of the process, we enumerate the OpenCL
+    platforms only once and cache the resulting environments for subsequent calls.
+
     Args:
         indices (List[int] or int): the indices of the CL devices to use. Either set this or preferred_device_type.
         device_type (str): the preferred device type, one of 'CPU', 'GPU' or 'APU'. If set, we ignore the indices
@@ -896,15 +905,20 @@ def get_cl_devices(indices=None, device_type=None):
         A list of CLEnvironments, one for each device in the system.
     """
     if device_type is not None:
-        return CLEnvironmentFactory.smart_device_selection(preferred_device_type=device_type)
+        if device_type not in _cl_devices_cache:
+            _cl_devices_cache[device_type] = CLEnvironmentFactory.smart_device_selection(
+                preferred_device_type=device_type)
+        return list(_cl_devices_cache[device_type])
 
-    if indices is not None and not isinstance(indices, collections.Iterable):
+    if isinstance(indices, (int, np.integer)):
         indices = [indices]
 
-    envs = CLEnvironmentFactory.smart_device_selection()
+    if None not in _cl_devices_cache:
+        _cl_devices_cache[None] = CLEnvironmentFactory.smart_device_selection()
+    envs = _cl_devices_cache[None]
 
     if indices is None:
-        return envs
+        return list(envs)
 
     return [envs[ind] for ind in indices]
 
@@ -1109,11 +1123,12 @@ def estimate_noise_std(input_data):
 
     def all_unweighted_volumes(input_data):
         unweighted_indices = input_data.protocol.get_unweighted_indices()
-        unweighted_volumes = input_data.signal4d[..., unweighted_indices]
 
         if len(unweighted_indices) < 2:
             raise NoiseStdEstimationNotPossible('Not enough unweighted volumes for this estimator.')
 
+        unweighted_volumes = input_data.signal4d[..., unweighted_indices]
+
         voxel_list = create_roi(unweighted_volumes, input_data.mask)
         return np.mean(np.std(voxel_list, axis=1))
 
@@ -6,6 +6,11 @@ import nibabel
 import numpy as np
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
 import mdt
 import mdt.visualization.layouts
 from mdt.lib.nifti import load_nifti, NiftiInfoDecorated
@@ -1373,7 +1378,7 @@ class MapPlotConfig(SimpleConvertibleConfig):
 
     @classmethod
     def from_yaml(cls, text):
-        return cls.get_conversion_info().from_dict(yaml.safe_load(text))
+        return cls.get_conversion_info().from_dict(yaml.load(text, Loader=YamlSafeLoader))
 
     @classmethod
     def from_dict(cls, config_dict):
@@ -1416,7 +1421,7 @@ class MapPlotConfig(SimpleConvertibleConfig):
         Returns:
             str: a YAML representation of this configuration.
         """
-        return yaml.safe_dump(self.to_dict(non_default_only=non_default_only))
+        return yaml.dump(self.to_dict(non_default_only=non_default_only), Dumper=YamlSafeDumper)
 
     def visible_changes(self, old_config):
         """Checks if there are any visible changes between this configuration and the other.
@@ -1671,7 +1676,7 @@ class SingleMapConfig(SimpleConvertibleConfig):
 
     @classmethod
     def from_yaml(cls, text):
-        return cls.get_conversion_info().from_dict(yaml.safe_load(text))
+        return cls.get_conversion_info().from_dict(yaml.load(text, Loader=YamlSafeLoader))
 
     @classmethod
     def from_dict(cls, config_dict):
@@ -1706,7 +1711,7 @@ class SingleMapConfig(SimpleConvertibleConfig):
         Returns:
             str: a YAML representation of this configuration.
         """
-        return yaml.safe_dump(self.to_dict(non_default_only=non_default_only))
+        return yaml.dump(self.to_dict(non_default_only=non_default_only), Dumper=YamlSafeDumper)
 
     def visible_changes(self, old_config):
         """Checks if there are any visible changes between this configuration and the other.